@@ -13,6 +13,7 @@
 #-----------------------------------------------------------------------------
 import threading
 import pyrogue as pr
+from pyrogue._Node import _functionArgs
 
 
 def startTransaction(block, *, type, forceWr=False, checkEach=False, variable=None, index=-1, **kwargs):
@@ -50,6 +51,8 @@ class LocalBlock(object):
         self._device    = variable.parent
         self._localSet  = localSet
         self._localGet  = localGet
+        self._setArgs   = _functionArgs(localSet) if localSet is not None else []
+        self._getArgs   = _functionArgs(localGet) if localGet is not None else []
         self._variable  = variable
         self._variables = [variable] # Used by poller
         self._value     = value
@@ -110,7 +113,7 @@ class LocalBlock(object):
                 # Possible args
                 pargs = {'dev' : self._device, 'var' : self._variable, 'value' : self._value, 'changed' : changed}
 
-                pr.varFuncHelper(self._localSet, pargs, self._log, self._variable.path)
+                pr.varFuncHelper(self._localSet, pargs, self._log, self._variable.path, self._setArgs)
 
     def get(self, var, index):
         if self._enable and self._localGet is not None:
@@ -119,7 +122,7 @@ class LocalBlock(object):
                 # Possible args
                 pargs = {'dev' : self._device, 'var' : self._variable}
 
-                self._value = pr.varFuncHelper(self._localGet,pargs, self._log, self._variable.path)
+                self._value = pr.varFuncHelper(self._localGet,pargs, self._log, self._variable.path, self._getArgs)
 
         if index >= 0:
             return self._value[index]
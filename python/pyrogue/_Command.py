@@ -13,6 +13,7 @@ import rogue.interfaces.memory
 import pyrogue as pr
 import inspect
 import threading
+from pyrogue._Variable import _functionArgs
 
 
 class CommandError(Exception):
@@ -51,6 +52,7 @@ class BaseCommand(pr.BaseVariable):
             guiGroup=guiGroup)
 
         self._function = function if function is not None else BaseCommand.nothing
+        self._functionArgs = _functionArgs(self._function)
         self._thread = None
         self._lock = threading.Lock()
         self._background = background
@@ -113,7 +115,7 @@ class BaseCommand(pr.BaseVariable):
             # Possible args
             pargs = {'dev' : self.parent, 'cmd' : self, 'arg' : arg}
 
-            return pr.varFuncHelper(self._function,pargs, self._log,self.path)
+            return pr.varFuncHelper(self._function,pargs, self._log,self.path,self._functionArgs)
 
         except Exception as e:
             pr.logException(self._log,e)
@@ -195,6 +197,7 @@ class BaseCommand(pr.BaseVariable):
 
     def replaceFunction(self, function):
         self._function = function
+        self._functionArgs = _functionArgs(function)
 
     def _setDict(self,d,writeEach,modes,incGroups,excGroups,keys):
         pass
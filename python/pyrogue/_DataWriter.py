@@ -9,7 +9,8 @@
 # copied, modified, propagated, or distributed except according to the terms
 # contained in the LICENSE.txt file.
 #-----------------------------------------------------------------------------
-import datetime
+import os
+import time
 import pyrogue as pr
 
 
@@ -129,11 +130,6 @@ class DataWriter(pr.Device):
         Auto create data file name based upon date and time.
         Preserve file's location in path.
         """
-        idx = self.DataFile.value().rfind('/')
+        base = os.path.dirname(self.DataFile.value())
 
-        if idx < 0:
-            base = ''
-        else:
-            base = self.DataFile.value()[:idx+1]
-
-        self.DataFile.set(base + datetime.datetime.now().strftime("data_%Y%m%d_%H%M%S.dat"))
+        self.DataFile.set(os.path.join(base, time.strftime("data_%Y%m%d_%H%M%S.dat")))
@@ -10,6 +10,7 @@
 # contained in the LICENSE.txt file.
 #-----------------------------------------------------------------------------
 import rogue.interfaces.memory as rim
+import bisect
 import collections
 import functools as ft
 import pyrogue as pr
@@ -40,6 +41,9 @@ class EnableVariable(pr.BaseVariable):
         self._value  = enabled
         self._lock   = threading.Lock()
 
+        # Dependency tracking in _doUpdate must run even when no one consumes the value
+        self._alwaysUpdate = len(self._deps) != 0
+
     def nativeType(self):
         return bool
 
@@ -142,12 +146,23 @@ class Device(pr.Node,rim.Hub):
 
         # Blocks
         self._blocks     = []
+        self._bulkBlocks = []
         self._custBlocks = []
         self._memBase    = memBase
         self._memLock    = threading.RLock()
         self._size       = size
         self._defaults   = defaults if defaults is not None else {}
 
+        # Child devices, maintained by add()
+        self._devList    = []
+
+        # Enabled state and enabled child devices, maintained by _updateBlockEnable()
+        self._enabled    = True
+        self._enDevList  = []
+
+        # Recursive device list, flattened once the tree is attached
+        self._allDevices = None
+
         if size != 0:
             print("")
             print("============ Deprecation Warning =========================")
@@ -200,6 +215,20 @@ class Device(pr.Node,rim.Hub):
     def size(self):
         return self._size
 
+    @property
+    def deviceList(self):
+        """
+        Get a recursive list of devices
+        """
+        if self._allDevices is not None:
+            return list(self._allDevices)
+
+        lst = []
+        for value in self._devList:
+            lst.append(value)
+            lst.extend(value.deviceList)
+        return lst
+
     def addCustomBlock(self, block):
         self._custBlocks.append(block)
         self._custBlocks.sort(key=lambda x: (x.offset, x.size))
@@ -210,6 +239,8 @@ class Device(pr.Node,rim.Hub):
 
         # Adding device
         if isinstance(node,Device):
+            self._devList.append(node)
+            self._enDevList.append(node)
 
             # Device does not have a membase
             if node._memBase is None:
@@ -228,7 +259,7 @@ class Device(pr.Node,rim.Hub):
         for intf in self._ifAndProto:
             if hasattr(intf,"_start"):
                 intf._start()
-        for d in self.deviceList:
+        for d in self._devList:
             d._start()
 
     def _stop(self):
@@ -236,7 +267,7 @@ class Device(pr.Node,rim.Hub):
         for intf in self._ifAndProto:
             if hasattr(intf,"_stop"):
                 intf._stop()
-        for d in self.deviceList:
+        for d in self._devList:
             d._stop()
 
     def addRemoteVariables(self, number, stride, pack=False, **kwargs):
@@ -290,15 +321,15 @@ class Device(pr.Node,rim.Hub):
                 self.variables[v].hidden = hidden
 
     def initialize(self):
-        for key,value in self.devices.items():
+        for value in self._devList:
             value.initialize()
 
     def hardReset(self):
-        for key,value in self.devices.items():
+        for value in self._devList:
             value.hardReset()
 
     def countReset(self):
-        for key,value in self.devices.items():
+        for value in self._devList:
             value.countReset()
 
     def enableChanged(self,value):
@@ -317,12 +348,11 @@ class Device(pr.Node,rim.Hub):
             pr.startTransaction(variable._block, type=rim.Write, forceWr=force, checkEach=checkEach, variable=variable, index=index, **kwargs)
 
         else:
-            for block in self._blocks:
-                if block.bulkOpEn:
-                    pr.startTransaction(block, type=rim.Write, forceWr=force, checkEach=checkEach, **kwargs)
+            for block in self._bulkBlocks:
+                pr.startTransaction(block, type=rim.Write, forceWr=force, checkEach=checkEach, **kwargs)
 
             if recurse:
-                for key,value in self.devices.items():
+                for value in self._enDevList:
                     value.writeBlocks(force=force, recurse=True, checkEach=checkEach, **kwargs)
 
     def verifyBlocks(self, *, recurse=True, variable=None, checkEach=False, **kwargs):
@@ -335,12 +365,11 @@ class Device(pr.Node,rim.Hub):
             pr.startTransaction(variable._block, type=rim.Verify, checkEach=checkEach, **kwargs) # Verify range is set by previous write
 
         else:
-            for block in self._blocks:
-                if block.bulkOpEn:
-                    pr.startTransaction(block, type=rim.Verify, checkEach=checkEach, **kwargs)
+            for block in self._bulkBlocks:
+                pr.startTransaction(block, type=rim.Verify, checkEach=checkEach, **kwargs)
 
             if recurse:
-                for key,value in self.devices.items():
+                for value in self._enDevList:
                     value.verifyBlocks(recurse=True, checkEach=checkEach, **kwargs)
 
     def readBlocks(self, *, recurse=True, variable=None, checkEach=False, index=-1, **kwargs):
@@ -353,12 +382,11 @@ class Device(pr.Node,rim.Hub):
             pr.startTransaction(variable._block, type=rim.Read, checkEach=checkEach, variable=variable, index=index, **kwargs)
 
         else:
-            for block in self._blocks:
-                if block.bulkOpEn:
-                    pr.startTransaction(block, type=rim.Read, checkEach=checkEach, **kwargs)
+            for block in self._bulkBlocks:
+                pr.startTransaction(block, type=rim.Read, checkEach=checkEach, **kwargs)
 
             if recurse:
-                for key,value in self.devices.items():
+                for value in self._enDevList:
                     value.readBlocks(recurse=True, checkEach=checkEach, **kwargs)
 
     def checkBlocks(self, *, recurse=True, variable=None, **kwargs):
@@ -371,7 +399,7 @@ class Device(pr.Node,rim.Hub):
                 pr.checkTransaction(block, **kwargs)
 
             if recurse:
-                for key,value in self.devices.items():
+                for value in self._devList:
                     value.checkBlocks(recurse=True, **kwargs)
 
     def writeAndVerifyBlocks(self, force=False, recurse=True, variable=None, checkEach=False):
@@ -386,11 +414,23 @@ class Device(pr.Node,rim.Hub):
         self.checkBlocks(recurse=recurse, variable=variable)
 
     def _updateBlockEnable(self):
+        self._setEnabled()
+
+        # Refresh the parent's view of this device
+        if isinstance(self._parent,Device) and self._parent is not self:
+            self._parent._enDevList = [value for value in self._parent._devList if value._enabled]
+
+    def _setEnabled(self):
+        self._enabled = self.enable.value() is True
+
         for block in self._blocks:
-            block.setEnable(self.enable.value() is True)
+            block.setEnable(self._enabled)
+
+        for value in self._devList:
+            value._setEnabled()
 
-        for key,value in self.devices.items():
-            value._updateBlockEnable()
+        # Disabled sub-trees are skipped by the bulk write, verify and read sweeps
+        self._enDevList = [value for value in self._devList if value._enabled]
 
     def _rawTxnChunker(self, offset, data, base=pr.UInt, stride=4, wordBitSize=32, txnType=rim.Write, numWords=1):
 
@@ -469,7 +509,9 @@ class Device(pr.Node,rim.Hub):
                     if numWords == 1:
                         return base.fromBytes(ldata)
                     else:
-                        return [base.fromBytes(ldata[i:i+stride]) for i in range(0, len(ldata), stride)]
+                        mv = base._wordSource(ldata)
+                        fromBytes = base.fromBytes
+                        return [fromBytes(mv[i:i+stride]) for i in range(0, len(ldata), stride)]
                 self._log.warning("Retrying raw read transaction")
 
             # If we get here an error has occurred
@@ -499,6 +541,12 @@ class Device(pr.Node,rim.Hub):
         blocks = []
         blk = None
 
+        # Pre-made blocks are kept sorted by offset, search them by bisection
+        # If pre-made blocks overlap each other more than one may contain a variable,
+        # then scan the blocks up to the bisection point for the first match
+        custOffsets = [b.offset for b in self._custBlocks]
+        custOverlap = any((a.offset + a.size) > b.offset for a, b in zip(self._custBlocks, self._custBlocks[1:]))
+
         # Go through sorted variable list, look for overlaps, group into blocks
         for n in remVars:
 
@@ -508,23 +556,35 @@ class Device(pr.Node,rim.Hub):
                 blk['vars'].append(n)
 
                 if n.varBytes > blk['size']:
+
+                    # Pre-made block size is fixed, variable extends past the end, user mistake
+                    if blk['block'] is not None:
+                        msg = f'Failed to add variable {n.name} to pre-made block with offset {blk["offset"]} and size {blk["size"]}'
+                        raise pr.MemoryError(name=self.path, address=self.address, msg=msg)
+
                     blk['size'] = n.varBytes
 
             # We need a new block for this variable
             else:
                 blk = None
 
-                # Look for pre-made block which overlaps
-                for b in self._custBlocks:
-                    if ( (n.offset >= b.offset) and ((b.offset + b.size) > n.offset)):
+                # Look for pre-made block which overlaps, bisection gives the last one starting at or before the variable
+                idx = bisect.bisect_right(custOffsets, n.offset) - 1
 
-                        # Just in case a variable extends past the end of pre-made block, user mistake
-                        if n.varBytes > b.size:
-                            msg = 'Failed to add variable {n.name} to pre-made block with offset {b.offset} and size {b.size}'
-                            raise pr.MemoryError(name=self.path, address=self.address, msg=msg)
+                if custOverlap:
+                    idx = next((i for i in range(idx+1) if (self._custBlocks[i].offset + self._custBlocks[i].size) > n.offset), -1)
 
-                        blk = {'offset':b.offset, 'size':b.size, 'vars':[n], 'block':b}
-                        break
+                if idx >= 0 and (self._custBlocks[idx].offset + self._custBlocks[idx].size) > n.offset:
+                    b = self._custBlocks[idx]
+
+                    # Just in case a variable extends past the end of pre-made block, user mistake
+                    if (n.offset - b.offset) + n.varBytes > b.size:
+                        msg = f'Failed to add variable {n.name} to pre-made block with offset {b.offset} and size {b.size}'
+                        raise pr.MemoryError(name=self.path, address=self.address, msg=msg)
+
+                    n._shiftOffsetDown(n.offset - b.offset, blkSize)
+                    blk = {'offset':b.offset, 'size':b.size, 'vars':[n], 'block':b}
+                    blocks.append(blk)
 
                 # Block not found
                 if blk is None:
@@ -570,8 +630,16 @@ class Device(pr.Node,rim.Hub):
         for key,value in self._nodes.items():
             value._rootAttached(self,root)
 
+        # The tree can not change once attached
+        self._allDevices = self.deviceList
+        self._enabled    = self.enable.value() is True
+        self._enDevList  = [value for value in self._devList if value._enabled]
+
         self._buildBlocks()
 
+        # Blocks taking part in bulk writes, verifies and reads, fixed once built
+        self._bulkBlocks = [block for block in self._blocks if block.bulkOpEn]
+
         # Override defaults as dictated by the _defaults dict
         for varName, defValue in self._defaults.items():
             nodes,keys = self.nodeMatch(varName)
@@ -595,9 +663,8 @@ class Device(pr.Node,rim.Hub):
 
         rim.Master._setTimeout(self, int(timeout*1000000))
 
-        for key,value in self._nodes.items():
-            if isinstance(value,Device):
-                value._setTimeout(timeout)
+        for value in self._devList:
+            value._setTimeout(timeout)
 
     def command(self, **kwargs):
         """A Decorator to add inline constructor functions as commands"""
@@ -20,6 +20,10 @@ import rogue.interfaces.memory
 
 from collections import OrderedDict as odict
 
+# Use the libyaml backed loader and dumper when PyYAML was built with it
+_YamlLoader = getattr(yaml, 'CLoader', yaml.Loader)
+_YamlDumper = getattr(yaml, 'CDumper', yaml.Dumper)
+
 
 def addLibraryPath(path):
     """
@@ -177,7 +181,7 @@ def yamlToData(stream='',fName=None):
 
     log = pr.logInit(name='yamlToData')
 
-    class PyrogueLoader(yaml.Loader):
+    class PyrogueLoader(_YamlLoader):
         pass
 
     def include_mapping(loader, node):
@@ -230,7 +234,7 @@ def yamlToData(stream='',fName=None):
 def dataToYaml(data):
     """Convert data structure to yaml"""
 
-    class PyrogueDumper(yaml.Dumper):
+    class PyrogueDumper(_YamlDumper):
         pass
 
     def _var_representer(dumper, data):
@@ -263,9 +267,7 @@ def keyValueUpdate(old, key, value):
     d = old
     parts = key.split('.')
     for part in parts[:-1]:
-        if part not in d:
-            d[part] = {}
-        d = d.get(part)
+        d = d.setdefault(part, {})
     d[parts[-1]] = value
 
 
@@ -9,12 +9,17 @@
 #-----------------------------------------------------------------------------
 import pyrogue as pr
 import rogue.interfaces.memory as rim
-from collections import OrderedDict as odict
 import collections
+import struct
 import threading
 
 
 class MemoryDevice(pr.Device):
+
+    # Transaction types used by the block loops
+    _TXN_WRITE  = rim.Write
+    _TXN_VERIFY = rim.Verify
+
     def __init__(self, *,
                  name=None,
                  description='',
@@ -53,11 +58,22 @@ class MemoryDevice(pr.Device):
         self._stride = stride
         self._verify = verify
 
-        self._setValues = odict()
-        self._wrValues = odict() # parsed from yaml
-        self._verValues = odict()
-        self._wrData = odict() # byte arrays written
-        self._verData = odict() # verify the written data
+        # Plain unsigned words that fill the stride can be packed with a single struct call
+        if type(self._base) in (pr.UInt, pr.UIntBE) and self._base.bitSize == stride*8 and stride in (1,2,4,8):
+            self._packFmt = ('>' if self._base.isBigEndian else '<') + '{}' + {1:'B', 2:'H', 4:'I', 8:'Q'}[stride]
+        else:
+            self._packFmt = None
+
+        # Compiled pack formats, keyed by word count
+        self._packStructs = {}
+
+        # Full width words without bit reversal decode one to one, verify can compare raw bytes
+        self._rawVerify = self._base.bitSize == stride*8 and not self._base.bitReverse
+
+        self._setValues = {}
+        self._wrValues = {} # parsed from yaml
+        self._wrData = {} # byte arrays written
+        self._verData = {} # verify the written data
 
 
     def _buildBlocks(self):
@@ -75,47 +91,77 @@ class MemoryDevice(pr.Device):
     @pr.expose
     def get(self, offset, numWords):
         with self._txnLock:
-            #print(f'get() self._wordBitSize={self._wordBitSize}')
             data = self._txnChunker(offset=offset, data=None,
                                     base=self._base, stride=self._stride,
                                     wordBitSize=self._wordBitSize, txnType=rim.Read,
                                     numWords=numWords)
             self._waitTransaction(0)
             self._clearError()
-            return [self._base.fromBytes(data[i:i+self._stride])
-                    for i in range(0, len(data), self._stride)]
+
+            # Slice through a memoryview to avoid a copy per word
+            mv = self._base._wordSource(data)
+            stride = self._stride
+            fromBytes = self._base.fromBytes
+            return [fromBytes(mv[i:i+stride]) for i in range(0, len(data), stride)]
 
 
     def _setDict(self, d, writeEach, modes,incGroups,excGroups,keys):
         # Parse comma separated values at each offset (key) in d
+        # Parsing is done before taking the lock to keep the hold time short
+        fromString = self._base.fromString
+        parsed = {offset: list(map(fromString, values.split(','))) for offset, values in d.items()}
+
         with self._txnLock:
-            for offset, values in d.items():
-                self._setValues[offset] = [self._base.fromString(s) for s in values.split(',')]
+            self._setValues.update(parsed)
 
     def _getDict(self,modes,incGroups,excGroups):
         return None
 
     def writeBlocks(self, force=False, recurse=True, variable=None, checkEach=False):
+        # Nothing queued, skip the enable check and lock
+        if not self._setValues:
+            return
+
         if not self.enable.get():
             return
 
         with self._txnLock:
-            self._wrValues = self._setValues
+            # Written values are only needed to report verify errors
+            if self._verify:
+                self._wrValues = self._setValues
+
             for offset, values in self._setValues.items():
-                self._txnChunker(offset, values, self._base, self._stride, self._wordBitSize, rim.Write, len(values))
+                numWords = len(values)
+
+                if self._packFmt is not None and not isinstance(values, bytearray):
+                    packer = self._packStructs.get(numWords)
+                    if packer is None:
+                        packer = self._packStructs[numWords] = struct.Struct(self._packFmt.format(numWords))
+
+                    # Out of range words fall back to the per word Model conversion,
+                    # which raises the same OverflowError as before
+                    try:
+                        values = bytearray(packer.pack(*values))
+                    except struct.error:
+                        pass
+
+                wdata = self._txnChunker(offset, values, self._base, self._stride, self._wordBitSize, self._TXN_WRITE, numWords)
+                if self._verify:
+                    self._wrData[offset] = wdata
 
             # clear out setValues when done
-            self._setValues = odict()
+            self._setValues = {}
 
 
     def verifyBlocks(self, recurse=True, variable=None, checkEach=False):
-        if (not self._verify) or (not self.enable.get()):
+        if (not self._verify) or (not self._wrData) or (not self.enable.get()):
             return
 
         with self._txnLock:
-            for offset, ba in self._wrValues.items():
-                # _verValues will not be filled until waitTransaction completes
-                self._verValues[offset] = self._txnChunker(offset, None, self._base, self._stride, self._wordBitSize, txnType=rim.Verify, numWords=len(ba))
+            for offset, ba in self._wrData.items():
+                # Read back exactly the bytes that were written
+                # _verData will not be filled until waitTransaction completes
+                self._verData[offset] = self._txnChunker(offset, bytearray(len(ba)), self._base, self._stride, self._wordBitSize, txnType=self._TXN_VERIFY, numWords=len(ba)//self._stride)
 
     def checkBlocks(self, recurse=True, variable=None):
         with self._txnLock:
@@ -125,32 +171,49 @@ class MemoryDevice(pr.Device):
             # Error check?
             self._clearError()
 
-            # Convert the read verify data back to the native type
-            # Can't do this until waitTransaction is done
-            checkValues = odict()
-            for offset, ba in self._verValues.items():
-                checkValues[offset] = [self._base.fromBytes(ba[i:i+self._stride])
-                                       for i in range(0, len(ba), self._stride)]
-
             # Do verify if necessary
-            if len(self._verValues) > 0:
-                # Compare wrData with verData
-                if checkValues != self._wrValues:
+            if len(self._verData) > 0:
+                # Compare the raw bytes when the model maps them one to one,
+                # otherwise compare the read back data converted to the native type
+                if self._rawVerify:
+                    checkValues = None
+                    match = self._verData == self._wrData
+                else:
+                    checkValues = self._decodeVerData()
+                    match = checkValues == self._wrValues
+
+                if not match:
+
+                    # Convert the read verify data back to the native type for the error message
+                    if checkValues is None:
+                        checkValues = self._decodeVerData()
+
                     msg = 'Verify error \n'
                     msg += f'Expected: \n {self._wrValues} \n'
                     msg += f'Got: \n {checkValues}'
-                    print(msg)
-                    raise MemoryError(name=self.name, address=self.address, msg=msg, size=self._rawSize)
+                    self._log.debug(msg)
+                    raise pr.MemoryError(name=self.name, address=self.address, msg=msg, size=self._rawSize)
 
 
             # destroy the txn maps when done with verify
-            self._verValues = odict()
-            self._wrValues = odict()
+            self._wrValues = {}
+            self._wrData = {}
+            self._verData = {}
 
 
     def readBlocks(self, recurse=True, variable=None, checkEach=False):
         pass
 
+    def _decodeVerData(self):
+        # Can't do this until waitTransaction is done
+        stride = self._stride
+        fromBytes = self._base.fromBytes
+        checkValues = {}
+        for offset, ba in self._verData.items():
+            mv = self._base._wordSource(ba)
+            checkValues[offset] = [fromBytes(mv[i:i+stride]) for i in range(0, len(ba), stride)]
+        return checkValues
+
     @pr.expose
     @property
     def size(self):
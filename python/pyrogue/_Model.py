@@ -25,12 +25,9 @@ def byteCount(bits):
 
 
 def reverseBits(value, bitSize):
-    result = 0
-    for i in range(bitSize):
-        result <<= 1
-        result |= value & 1
-        value >>= 1
-    return result
+    # Reverse the binary string representation, this keeps the per bit loop in C
+    value &= (1 << bitSize) - 1
+    return int(f'{value:0{bitSize}b}'[::-1], 2)
 
 
 def twosComplement(value, bitSize):
@@ -46,7 +43,8 @@ class ModelMeta(type):
         cls.subclasses = {}
 
     def __call__(cls, *args, **kwargs):
-        key = cls.__name__ + str(args) + str(kwargs)
+        # Instances are cached per class, so only the arguments form the key
+        key = (args, frozenset(kwargs.items()))
 
         if key not in cls.subclasses:
             #print(f'Key: {key}')
@@ -56,6 +54,7 @@ class ModelMeta(type):
 
 
 class Model(object, metaclass=ModelMeta):
+    __slots__   = ('bitSize', 'binPoint', 'name', '_byteLen', '_signLimit', '_mod')
     fstring     = None
     encoding    = None
     pytype      = None
@@ -70,10 +69,22 @@ class Model(object, metaclass=ModelMeta):
         self.bitSize  = bitSize
         self.name     = self.__class__.__name__
 
+        # Precompute constants used by the conversion functions
+        self._byteLen   = byteCount(bitSize)
+        self._signLimit = 1 << (bitSize - 1) if bitSize > 0 else 0
+        self._mod       = 1 << bitSize
+
     @property
     def isBigEndian(self):
         return self.endianness == 'big'
 
+    def _wordSource(self, ba):
+        """Buffer to slice words from for fromBytes, a memoryview for the built in conversions"""
+        # User defined fromBytes overrides keep getting the bytearray slices they always did
+        if getattr(getattr(type(self), 'fromBytes', None), '__module__', None) == __name__:
+            return memoryview(ba)
+        return ba
+
     def minValue(self):
         return None
 
@@ -82,6 +93,7 @@ class Model(object, metaclass=ModelMeta):
 
 
 class UInt(Model):
+    __slots__   = ()
     pytype      = int
     defaultdisp = '{:#x}'
     modelId     = rim.UInt
@@ -91,90 +103,103 @@ class UInt(Model):
         self.name = f'{self.__class__.__name__}{self.bitSize}'
 
     # Called by raw read/write and when bitsize > 64
+    # Unsigned conversion is the int default, signed models override these
     def toBytes(self, value):
-        return value.to_bytes(byteCount(self.bitSize), self.endianness, signed=self.signed)
+        return value.to_bytes(self._byteLen, self.endianness)
 
     # Called by raw read/write and when bitsize > 64
     def fromBytes(self, ba):
-        return int.from_bytes(ba, self.endianness, signed=self.signed)
+        return int.from_bytes(ba, self.endianness)
 
-    def fromString(self, string):
+    # No instance state needed, skip creating a bound method per call
+    @staticmethod
+    def fromString(string):
         return int(string, 0)
 
     def minValue(self):
         return 0
 
     def maxValue(self):
-        return (2**self.bitSize)-1
+        return self._mod-1
 
 
 class UIntReversed(UInt):
     """Converts Unsigned Integer to and from bytearray with reserved bit ordering"""
+    __slots__ = ()
     modelId   = rim.PyFunc # Not yet supported
     bitReverse = True
 
     def toBytes(self, value):
         valueReverse = reverseBits(value, self.bitSize)
-        return valueReverse.to_bytes(byteCount(self.bitSize), self.endianness, signed=self.signed)
+        return valueReverse.to_bytes(self._byteLen, self.endianness)
 
     def fromBytes(self, ba):
-        valueReverse = int.from_bytes(ba, self.endianness, signed=self.signed)
+        valueReverse = int.from_bytes(ba, self.endianness)
         return reverseBits(valueReverse, self.bitSize)
 
 
 class Int(UInt):
+    __slots__   = ('_needsSignExt',)
 
     # Override these and inherit everything else from UInt
     defaultdisp = '{:d}'
     signed      = True
     modelId     = rim.Int
 
+    def __init__(self, bitSize):
+        super().__init__(bitSize)
+
+        # Sign extension is needed when the value does not fill the bytes
+        self._needsSignExt = self.bitSize < (self._byteLen * 8)
+
     # Called by raw read/write and when bitsize > 64
     def toBytes(self, value):
-        if (value < 0) and (self.bitSize < (byteCount(self.bitSize) * 8)):
-            newValue = value & (2**(self.bitSize)-1) # Strip upper bits
-            ba = newValue.to_bytes(byteCount(self.bitSize), self.endianness, signed=False)
+        if (value < 0) and self._needsSignExt:
+            newValue = value & (self._mod-1) # Strip upper bits
+            ba = newValue.to_bytes(self._byteLen, self.endianness, signed=False)
         else:
-            ba = value.to_bytes(byteCount(self.bitSize), self.endianness, signed=True)
+            ba = value.to_bytes(self._byteLen, self.endianness, signed=True)
 
         return ba
 
     # Called by raw read/write and when bitsize > 64
     def fromBytes(self,ba):
-        if (self.bitSize < (byteCount(self.bitSize)*8)):
-            value = int.from_bytes(ba, self.endianness, signed=False)
+        if not self._needsSignExt:
+            return int.from_bytes(ba, self.endianness, signed=True)
 
-            if value >= 2**(self.bitSize-1):
-                value -= 2**self.bitSize
+        value = int.from_bytes(ba, self.endianness, signed=False)
 
-        else:
-            value = int.from_bytes(ba, self.endianness, signed=True)
+        if value >= self._signLimit:
+            value -= self._mod
 
-        return
+        return value
 
     def fromString(self, string):
         i = int(string, 0)
         # perform twos complement if necessary
-        if i>0 and ((i >> self.bitSize) & 0x1 == 1):
-            i = i - (1 << self.bitSize)
+        if i>0 and (i & self._mod):
+            i = i - self._mod
         return i
 
     def minValue(self):
-        return -1 * ((2**(self.bitSize-1))-1)
+        return -1 * (self._signLimit-1)
 
     def maxValue(self):
-        return (2**(self.bitSize-1))-1
+        return self._signLimit-1
 
 
 class UIntBE(UInt):
+    __slots__ = ()
     endianness = 'big'
 
 
 class IntBE(Int):
+    __slots__ = ()
     endianness = 'big'
 
 
 class Bool(Model):
+    __slots__   = ()
     pytype      = bool
     defaultdisp = {False: 'False', True: 'True'}
     modelId     = rim.Bool
@@ -194,6 +219,7 @@ class Bool(Model):
 
 
 class String(Model):
+    __slots__   = ()
     encoding    = 'utf-8'
     defaultdisp = '{}'
     pytype      = str
@@ -210,6 +236,7 @@ class String(Model):
 class Float(Model):
     """Converter for 32-bit float"""
 
+    __slots__   = ()
     defaultdisp = '{:f}'
     pytype      = float
     fstring     = 'f'
@@ -231,6 +258,7 @@ class Float(Model):
 
 
 class Double(Float):
+    __slots__ = ()
     fstring = 'd'
     modelId   = rim.Double
 
@@ -247,16 +275,19 @@ class Double(Float):
 
 
 class FloatBE(Float):
+    __slots__ = ()
     endianness = 'big'
     fstring = '!f'
 
 
 class DoubleBE(Double):
+    __slots__ = ()
     endianness = 'big'
     fstring = '!d'
 
 
 class Fixed(Model):
+    __slots__ = ()
     pytype = float
     signed = True
     modelId   = rim.Fixed
@@ -14,12 +14,14 @@ from collections import OrderedDict as odict
 import logging
 import re
 import inspect
+import rogue
 import pyrogue as pr
 import collections
 
 
 def logException(log,e):
-    if isinstance(e,pr.MemoryError):
+    # Hardware access errors can repeat on every poll, only format their traceback when debugging
+    if isinstance(e,pr.MemoryError) or (isinstance(e,rogue.GeneralError) and not log.isEnabledFor(logging.DEBUG)):
         log.error(e)
     else:
         log.exception(e)
@@ -97,18 +99,18 @@ class Node(object):
     def __init__(self, *, name, description="", expand=True, hidden=False, groups=None, guiGroup=None):
         """Init the node with passed attributes"""
 
-        # Public attributes
-        self._name        = name
+        # Public attributes, names are interned since they are used as lookup keys
+        self._name        = sys.intern(name)
         self._description = description
-        self._path        = name
+        self._path        = self._name
         self._expand      = expand
         self._guiGroup    = guiGroup
 
         # Tracking
         self._parent  = None
         self._root    = None
-        self._nodes   = odict()
-        self._anodes  = odict()
+        self._nodes   = {}
+        self._anodes  = {}
 
         # Setup logging
         self._log = logInit(cls=self,name=name,path=None)
@@ -217,26 +219,13 @@ class Node(object):
 
         attr['name']        = self._name
         attr['class']       = self.__class__.__name__
-        attr['bases']       = pr.genBaseList(self.__class__)
         attr['description'] = self._description
         attr['groups']      = self._groups
         attr['path']        = self._path
         attr['expand']      = self._expand
         attr['guiGroup']    = self._guiGroup
         attr['nodes']       = odict({k:None for k,v in self._nodes.items() if not v.inGroup('NoServe')})
-        attr['props']       = []
-        attr['funcs']       = {}
-
-        # Get properties
-        for k,v in inspect.getmembers(self.__class__, lambda a: isinstance(a,property)):
-            if hasattr(v.fget,'_rogueExposed'):
-                attr['props'].append(k)
-
-        # Get methods
-        for k,v in inspect.getmembers(self.__class__, callable):
-            if hasattr(v,'_rogueExposed'):
-                attr['funcs'][k] = {'args'   : [a for a in inspect.getfullargspec(v).args if a != 'self'],
-                                    'kwargs' : inspect.getfullargspec(v).kwonlyargs}
+        attr['bases'], attr['props'], attr['funcs'] = _classAttrs(self.__class__)
 
         return (pr.interfaces.VirtualFactory, (attr,))
 
@@ -358,7 +347,7 @@ class Node(object):
     @property
     def nodes(self):
         """
-        Get a ordered dictionary of all nodes.
+        Get an insertion ordered dictionary of all nodes.
         """
         return self._nodes
 
@@ -518,9 +507,12 @@ class Node(object):
         """Called once the root node is attached."""
         self._parent = parent
         self._root   = root
-        self._path   = parent.path + '.' + self.name
+        self._path   = sys.intern(parent.path + '.' + self.name)
         self._log    = logInit(cls=self,name=self._name,path=self._path)
 
+        # The path is fixed once attached, register it with the root
+        root._pathIndex[self._path] = self
+
         # Inherit groups from parent
         for grp in parent.groups:
             self.addToGroup(grp)
@@ -626,7 +618,7 @@ def _iterateDict(d, keys):
             tmpList[k] = v
 
         try:
-            subList = eval(f'tmpList[{keys[0]}]')
+            subList = _sliceList(tmpList, keys[0])
         except Exception:
             subList = []
 
@@ -643,6 +635,52 @@ def _iterateDict(d, keys):
     return retList
 
 
+# Base list and exposed attributes only depend on the class, cache them for __reduce__
+_classCache = {}
+
+
+def _classAttrs(cls):
+    """Return the base list and the exposed properties and methods of a Node class"""
+    if cls not in _classCache:
+        props = []
+        funcs = {}
+
+        # Get properties
+        for k,v in inspect.getmembers(cls, lambda a: isinstance(a,property)):
+            if hasattr(v.fget,'_rogueExposed'):
+                props.append(k)
+
+        # Get methods
+        for k,v in inspect.getmembers(cls, callable):
+            if hasattr(v,'_rogueExposed'):
+                spec = inspect.getfullargspec(v)
+                funcs[k] = {'args'   : [a for a in spec.args if a != 'self'],
+                            'kwargs' : spec.kwonlyargs}
+
+        _classCache[cls] = (genBaseList(cls), props, funcs)
+
+    return _classCache[cls]
+
+
+def _sliceList(lst, key):
+    """Apply a python style index or slice string (ie '2', '-1', '1:5', '::2') to a list"""
+    if ':' in key:
+        return lst[slice(*[int(x) if x.strip() else None for x in key.split(':')])]
+    else:
+        return [lst[int(key)]]
+
+
+def _functionArgs(func):
+    """Return the names of the arguments func accepts, excluding self"""
+    try:
+        spec = inspect.getfullargspec(func)
+        return [k for k in spec.args + spec.kwonlyargs if k != 'self']
+
+    # handle c++ functions, no args supported for now
+    except Exception:
+        return []
+
+
 def genBaseList(cls):
     ret = [str(cls)]
 
@@ -158,8 +158,11 @@ class PollQueue(object):
                         except Exception as e:
                             pr.logException(self._log,e)
 
-                        # Update the entry with new read time
-                        entry.readTime = now + entry.interval
+                        # Update the entry with new read time, keeping a fixed rate
+                        # Resync to now if the poll has fallen a full interval behind
+                        entry.readTime += entry.interval
+                        if entry.readTime <= now:
+                            entry.readTime = now + entry.interval
                         entry.count = next(self._counter)
                         # Push the updated entry back into the queue
                         heapq.heappush(self._pq, entry)
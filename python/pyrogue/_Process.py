@@ -25,6 +25,11 @@ class Process(pr.Device):
         self._runEn  = False
         self._argVar = argVariable
 
+        # Persistent worker thread, created on first start
+        self._startEvent = threading.Event()
+        self._workEn     = True
+        self._busy       = False
+
         self.add(pr.LocalCommand(
             name='Start',
             function=self._startProcess,
@@ -61,13 +66,7 @@ class Process(pr.Device):
             description='Process status message. Prefix with Error: if an error occurred.'))
 
     def _startProcess(self):
-        with self._lock:
-            if self.Running.value() is False:
-                self._runEn  = True
-                self._thread = threading.Thread(target=self._run)
-                self._thread.start()
-            else:
-                self._log.warning("Process already running!")
+        self._launch()
 
     def _stopProcess(self):
         with self._lock:
@@ -75,21 +74,61 @@ class Process(pr.Device):
 
     def _stop(self):
         self._stopProcess()
+
+        # Wake up the worker so it can exit, let a running process finish
+        with self._lock:
+            self._workEn = False
+            self._startEvent.set()
+            thread = self._thread
+
+        # Bounded wait in case a _process override ignores _runEn, the daemon thread is abandoned
+        if thread is not None:
+            thread.join(timeout=5.0)
+
+            if thread.is_alive():
+                self._log.warning("Process did not stop within 5 seconds, abandoning it!")
+
         pr.Device._stop(self)
 
     def __call__(self,arg=None):
+        self._launch(arg)
+        return None
+
+    def _launch(self,arg=None):
         with self._lock:
-            if self.Running.value() is False:
+
+            # Worker has exited on stop, it can not be restarted
+            if not self._workEn:
+                self._log.warning("Process has been stopped, start ignored!")
+
+            # Busy is cleared by the worker once the process completes
+            elif not self._busy:
                 if arg is not None and self._argVar is not None:
                     self.nodes[self._argVar].setDisp(arg)
 
-                self._runEn  = True
-                self._thread = threading.Thread(target=self._run)
-                self._thread.start()
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._worker, daemon=True)
+                    self._thread.start()
+
+                self._busy  = True
+                self._runEn = True
+                self._startEvent.set()
             else:
                 self._log.warning("Process already running!")
 
-        return None
+    def _worker(self):
+        while True:
+            self._startEvent.wait()
+            self._startEvent.clear()
+
+            if self._workEn is False:
+                return
+
+            self._run()
+
+            # Stop may have arrived while the process was running
+            if self._workEn is False:
+                return
 
     def _run(self):
         self.Running.set(True)
@@ -99,6 +138,10 @@ class Process(pr.Device):
         except Exception as e:
             pr.logException(self._log,e)
 
+        # Accept a new start before Running drops so none are lost in between
+        with self._lock:
+            self._busy = False
+
         self.Running.set(False)
 
     def _process(self):
@@ -18,7 +18,6 @@ import threading
 import logging
 import pyrogue as pr
 import pyrogue.interfaces
-import functools as ft
 import time
 import queue
 import json
@@ -163,6 +162,9 @@ class Root(rogue.interfaces.stream.Master,pr.Device):
         # SQL URL
         self._sqlLog = None
 
+        # Index of attached nodes by full path, filled by _rootAttached
+        self._pathIndex = {}
+
         # Init
         pr.Device.__init__(self, name=name, description=description, expand=expand)
 
@@ -511,8 +513,17 @@ class Root(rogue.interfaces.stream.Master,pr.Device):
     def __reduce__(self):
         return pr.Node.__reduce__(self)
 
-    @ft.lru_cache(maxsize=None)
     def getNode(self,path):
+
+        # Accept root as an alias for the root name
+        if path == 'root' or path.startswith('root.'):
+            path = self.name + path[4:]
+
+        # Attached nodes are found with a single lookup
+        if path in self._pathIndex:
+            return self._pathIndex[path]
+
+        # Fall back to walking the tree
         obj = self
 
         if '.' in path:
@@ -660,11 +671,16 @@ class Root(rogue.interfaces.stream.Master,pr.Device):
         self._parent = self
         self._root   = self
         self._path   = self.name
+        self._pathIndex[self._path] = self
 
         for key,value in self._nodes.items():
             value._rootAttached(self,self)
 
+        self._allDevices = self.deviceList
+        self._enDevList  = [value for value in self._devList if value._enabled]
+
         self._buildBlocks()
+        self._bulkBlocks = [block for block in self._blocks if block.bulkOpEn]
 
         # Some variable initialization can run until the blocks are built
         for v in self.variables.values():
@@ -917,23 +933,43 @@ class Root(rogue.interfaces.stream.Master,pr.Device):
 
         while True:
             uvars = self._updateQueue.get()
+            count = 1
+            stop  = uvars is None
 
-            # Done
-            if uvars is None:
-                self._log.info("Stopping update thread")
-                self._updateQueue.task_done()
-                return
+            if stop:
+                uvars = {}
+
+            # Merge groups already waiting so they share one stream frame and publish
+            while not stop:
+                try:
+                    nxt = self._updateQueue.get_nowait()
+                except queue.Empty:
+                    break
+
+                count += 1
+
+                if nxt is None:
+                    stop = True
+                else:
+                    uvars.update(nxt)
 
             # Process list
-            elif len(uvars) > 0:
+            if len(uvars) > 0:
                 self._log.debug(F'Process update group. Length={len(uvars)}. Entry={list(uvars.keys())[0]}')
 
+                # Values are only built for variables when something consumes them
+                strmEn  = self._slaveCount() != 0
+                rootEn  = strmEn or self._zmqServer is not None or len(self._varListeners) > 0 or self._sqlLog is not None
+
                 for p,v in uvars.items():
+                    if not (rootEn or v._alwaysUpdate):
+                        continue
+
                     try:
                         val = v._doUpdate()
 
                         # Add to stream
-                        if self._slaveCount() != 0 and v.filterByGroup(self._streamIncGroups, self._streamExcGroups):
+                        if strmEn and v.filterByGroup(self._streamIncGroups, self._streamExcGroups):
                             strm[p] = val
 
                         # Add to zmq publish
@@ -975,4 +1011,10 @@ class Root(rogue.interfaces.stream.Master,pr.Device):
                 zmq = {}
 
             # Set done
-            self._updateQueue.task_done()
+            for _ in range(count):
+                self._updateQueue.task_done()
+
+            # Done
+            if stop:
+                self._log.info("Stopping update thread")
+                return
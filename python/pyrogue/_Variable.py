@@ -11,7 +11,6 @@
 #-----------------------------------------------------------------------------
 import pyrogue as pr
 import rogue.interfaces.memory as rim
-import inspect
 import threading
 import re
 import time
@@ -19,6 +18,7 @@ import shlex
 import numpy as np
 from collections import OrderedDict as odict
 from collections.abc import Iterable
+from pyrogue._Node import _sliceList, _functionArgs
 
 
 class VariableError(Exception):
@@ -145,6 +145,7 @@ class BaseVariable(pr.Node):
         self._isList        = False
         self._listeners     = []
         self.__functions    = []
+        self._alwaysUpdate  = False
         self.__dependencies = []
 
         # Build enum if specified
@@ -328,6 +329,7 @@ class BaseVariable(pr.Node):
         else:
             if listener not in self.__functions:
                 self.__functions.append(listener)
+                self._alwaysUpdate = True
 
     def delListener(self, listener):
         """
@@ -496,7 +498,7 @@ class BaseVariable(pr.Node):
                     for i in range(self._numValues()):
                         self.setDisp(d, write=writeEach, index=i)
                 else:
-                    idxSlice = eval(f'[i for i in range(self._numValues())][{keys[0]}]')
+                    idxSlice = _sliceList(list(range(self._numValues())), keys[0])
 
                     # Single entry item
                     if ':' not in keys[0]:
@@ -979,6 +981,10 @@ class LinkVariable(BaseVariable):
                 if arg not in kwargs:
                     kwargs[arg] = getattr(variable, arg)
 
+        # Argument names are looked up once, not on every access
+        self._linkedSetArgs = _functionArgs(self._linkedSet) if self._linkedSet else []
+        self._linkedGetArgs = _functionArgs(self._linkedGet) if self._linkedGet else []
+
         if not self._linkedSet:
             kwargs['mode'] = 'RO'
         if not self._linkedGet:
@@ -1009,7 +1015,7 @@ class LinkVariable(BaseVariable):
             # Possible args
             pargs = {'dev' : self.parent, 'var' : self, 'value' : value, 'write' : write, 'index' : index}
 
-            varFuncHelper(self._linkedSet,pargs,self._log,self.path)
+            varFuncHelper(self._linkedSet,pargs,self._log,self.path,self._linkedSetArgs)
 
     @pr.expose
     def get(self, read=True, index=-1):
@@ -1018,24 +1024,20 @@ class LinkVariable(BaseVariable):
             # Possible args
             pargs = {'dev' : self.parent, 'var' : self, 'read' : read, 'index' : index}
 
-            return varFuncHelper(self._linkedGet,pargs,self._log,self.path)
+            return varFuncHelper(self._linkedGet,pargs,self._log,self.path,self._linkedGetArgs)
         else:
             return None
 
 
 # Function helper
-def varFuncHelper(func,pargs,log,path):
-
-    try:
-        # Function args
-        fargs = inspect.getfullargspec(func).args + inspect.getfullargspec(func).kwonlyargs
+def varFuncHelper(func,pargs,log,path,fargs=None):
 
-        # Build overlapping arg list
-        args = {k:pargs[k] for k in fargs if k != 'self' and k in pargs}
+    # Callers which run often pass the argument names they looked up once
+    if fargs is None:
+        fargs = _functionArgs(func)
 
-    # handle c++ functions, no args supported for now
-    except Exception:
-        args = {}
+    # Build overlapping arg list
+    args = {k:pargs[k] for k in fargs if k in pargs}
 
     return func(**args)
 
@@ -11,7 +11,6 @@
 #-----------------------------------------------------------------------------
 
 import pyrogue as pr
-import sqlalchemy
 import threading
 import queue
 
@@ -19,6 +18,8 @@ import queue
 class SqlLogger(object):
 
     def __init__(self, url):
+        import sqlalchemy  # Only paid for when database logging is used
+
         self._log = pr.logInit(cls=self,name="SqlLogger",path=None)
         self._url = url
         self._conn   = None
@@ -109,6 +110,8 @@ class SqlLogger(object):
 class SqlReader(object):
 
     def __init__(self, url):
+        import sqlalchemy
+
         self._log = pr.logInit(cls=self,name="SqlReader",path=None)
         self._url = url
         self._conn = None
@@ -128,10 +131,12 @@ class SqlReader(object):
 
     # Make this more useful
     def getVariable(self):
+        import sqlalchemy
         r = self._conn.execute(sqlalchemy.select([self._varTable]))
         print(r.fetchall())
 
     # Make this more useful
     def getSyslog(self, syslogData):
+        import sqlalchemy
         r = self._conn.execute(sqlalchemy.select([self._logTable]))
         print(r.fetchall())
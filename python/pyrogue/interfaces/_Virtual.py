@@ -43,6 +43,7 @@ class VirtualMethod(object):
 def VirtualFactory(data):
 
     def __init__(self,data):
+        bases = frozenset(data['bases'])
 
         # Add dynamic methods
         for k,v in data['funcs'].items():
@@ -53,16 +54,16 @@ def VirtualFactory(data):
             setattr(self.__class__,k,VirtualProperty(self,k))
 
         # Add __call__ if command or Process
-        if str(pr.BaseCommand) in data['bases'] or str(pr.Process) in data['bases']:
+        if str(pr.BaseCommand) in bases or str(pr.Process) in bases:
             setattr(self.__class__,'__call__',self._call)
 
         # Add getNode and addVarListener if root
-        if str(pr.Root) in data['bases']:
+        if str(pr.Root) in bases:
             setattr(self.__class__,'getNode',self._getNode)
             setattr(self.__class__,'addVarListener',self._addVarListener)
 
         # Add addListener if Variable
-        if str(pr.BaseVariable) in data['bases']:
+        if str(pr.BaseVariable) in bases:
             setattr(self.__class__,'addListener',self._addListener)
             setattr(self.__class__,'delListener',self._delListener)
 
@@ -83,7 +84,7 @@ class VirtualNode(pr.Node):
         self._path  = attrs['path']
         self._class = attrs['class']
         self._nodes = attrs['nodes']
-        self._bases = attrs['bases']
+        self._bases = frozenset(attrs['bases'])
 
         # Tracking
         self._parent    = None
@@ -291,14 +292,16 @@ class VirtualClient(rogue.interfaces.ZmqClient):
             return
 
         d = pickle.loads(data)
+        getNode = self._root.getNode
+        listeners = self._varListeners
 
         for k,val in d.items():
-            n = self._root.getNode(k,False)
+            n = getNode(k,False)
             if n is not None:
                 n._doUpdate(val)
 
             # Call listener functions,
-            for func in self._varListeners:
+            for func in listeners:
                 func(k,val)
 
     def stop(self):
@@ -19,6 +19,10 @@ import serial
 import queue
 import threading
 
+# Command templates, formatted straight to bytes
+_WR_CMD = b'w %08x %08x \n'
+_RD_CMD = b'r %08x \n'
+
 class UartMemory(rogue.interfaces.memory.Slave):
     def __init__(self, device, baud, timeout=1, **kwargs):
         super().__init__(4,4096) # Set min and max size to 4 bytes
@@ -46,13 +50,18 @@ class UartMemory(rogue.interfaces.memory.Slave):
         self._stop()
 
     def readline(self):
-        line = []
+        line = bytearray()
         while True:
-            ch = self.serialPort.read().decode('ASCII')
-            line.append(ch)
-            if ch == '\n' or ch == '\r':
+            ch = self.serialPort.read()
+
+            # Timeout, return what has been received
+            if len(ch) == 0:
                 break
-        return ''.join(line)
+
+            line += ch
+            if ch == b'\n' or ch == b'\r':
+                break
+        return line.decode('ASCII')
 
     def _doTransaction(self, transaction):
         self._workerQueue.put(transaction)
@@ -63,11 +72,12 @@ class UartMemory(rogue.interfaces.memory.Slave):
         address = transaction.address()
         dataBa = bytearray(transaction.size())
         transaction.getData(dataBa, 0)
-        dataWords = [int.from_bytes(dataBa[i:i+4], 'little', signed=False) for i in range(0, len(dataBa), 4)]
+        dataMv = memoryview(dataBa)
+        dataWords = [int.from_bytes(dataMv[i:i+4], 'little', signed=False) for i in range(0, len(dataBa), 4)]
 
         # Need to issue a UART command for each 32 bit word
         for i, (addr, data) in enumerate(zip(range(address, address+len(dataBa), 4), dataWords)):
-            sendString = f'w {addr:08x} {data:08x} \n'.encode('ASCII')
+            sendString = _WR_CMD % (addr, data)
             # self._log.debug(f'Sending write transaction part {i}: {repr(sendString)}')
             self.serialPort.write(sendString)
             response = self.readline() #self.serialPort.readline().decode('ASCII')
@@ -101,9 +111,10 @@ class UartMemory(rogue.interfaces.memory.Slave):
 
         address = transaction.address()
         size = transaction.size()
+        rdData = bytearray(size)
 
         for i, addr in enumerate(range(address, address+size, 4)):
-            sendString = f'r {addr:08x} \n'.encode('ASCII')
+            sendString = _RD_CMD % addr
             # self._log.debug(f'Sending read transaction part {i}: {repr(sendString)}')
             self.serialPort.write(sendString)
             response = self.readline() #self.serialPort.readline().decode('ASCII')
@@ -118,10 +129,10 @@ class UartMemory(rogue.interfaces.memory.Slave):
 
             if (len(parts) != 4 or parts[0].lower() != 'r' or int(parts[1], 16) != addr):
                 transaction.error(f'Malformed response part {i}: {repr(response)} to transaction: {repr(sendString)}')
+                return
             else:
                 dataInt = int(parts[2], 16)
-                rdData = bytearray(dataInt.to_bytes(4, 'little', signed=False))
-                transaction.setData(rdData, i*4)
+                rdData[i*4:i*4+4] = dataInt.to_bytes(4, 'little', signed=False)
                 # self._log.debug(f'Transaction part {i}: {repr(sendString)} with response data: {dataInt:#08x} completed successfully')
 
             # Check response code
@@ -131,6 +142,7 @@ class UartMemory(rogue.interfaces.memory.Slave):
                 transaction.error(f"Non zero status message returned on axi bus in hardware: {resp:#x}")
                 return
 
+        transaction.setData(rdData, 0)
         transaction.done()
 
 
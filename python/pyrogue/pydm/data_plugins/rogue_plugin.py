@@ -77,6 +77,7 @@ class RogueConnection(PyDMConnection):
         self._int    = False
         self._node   = None
         self._enum   = None
+        self._enumIdx = None
         self._notDev = False
         self._address = address
 
@@ -94,6 +95,11 @@ class RogueConnection(PyDMConnection):
             if self._node.disp == 'enum' and self._node.enum is not None and self._node.mode != 'RO':
                 self._enum = list(self._node.enum.values())
 
+                # Reverse map from display value to list index, first entry wins
+                self._enumIdx = {}
+                for i,v in enumerate(self._enum):
+                    self._enumIdx.setdefault(v,i)
+
             elif self._mode == 'value' and ('Int' in self._node.typeStr or self._node.typeStr == 'int'):
                 self._int = True
 
@@ -115,7 +121,7 @@ class RogueConnection(PyDMConnection):
         elif self._mode == 'disp':
             self.new_value_signal[str].emit(varValue.valueDisp)
         elif self._enum is not None:
-            self.new_value_signal[int].emit(self._enum.index(varValue.valueDisp))
+            self.new_value_signal[int].emit(self._enumIdx[varValue.valueDisp])
         else:
             self.new_value_signal[type(varValue.value)].emit(varValue.value)
 
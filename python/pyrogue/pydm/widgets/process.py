@@ -23,6 +23,15 @@ class Process(PyDMFrame):
         PyDMFrame.__init__(self, parent, init_channel)
         self._node = None
 
+    @staticmethod
+    def _lineEdit(channel, precisionFromPV):
+        w = PyRogueLineEdit(parent=None, init_channel=channel)
+        w.showUnits             = False
+        w.precisionFromPV       = precisionFromPV
+        w.alarmSensitiveContent = False
+        w.alarmSensitiveBorder  = False
+        return w
+
     def connection_changed(self, connected):
         build = (self._node is None) and (self._connected != connected and connected is True)
         super(Process, self).connection_changed(connected)
@@ -57,12 +66,7 @@ class Process(PyDMFrame):
         fl.setLabelAlignment(Qt.AlignRight)
         hb.addLayout(fl)
 
-        w = PyRogueLineEdit(parent=None, init_channel=self._path + '.Running/disp')
-        w.showUnits             = False
-        w.precisionFromPV       = False
-        w.alarmSensitiveContent = False
-        w.alarmSensitiveBorder  = False
-
+        w = self._lineEdit(self._path + '.Running/disp', False)
         fl.addRow('Running:',w)
 
         fl = QFormLayout()
@@ -83,25 +87,13 @@ class Process(PyDMFrame):
 
         fl.addRow('Progress:',w)
 
-        w = PyRogueLineEdit(parent=None, init_channel=self._path + '.Message/disp')
-        w.showUnits             = False
-        w.precisionFromPV       = False
-        w.alarmSensitiveContent = False
-        w.alarmSensitiveBorder  = False
-
+        w = self._lineEdit(self._path + '.Message/disp', False)
         fl.addRow('Message:',w)
 
         # Auto add additional fields
-        noAdd = ['enable','Start','Stop','Running','Progress','Message']
-
-        prc = nodeFromAddress(self.channel)
+        noAdd = frozenset(('enable','Start','Stop','Running','Progress','Message'))
 
-        for k,v in prc.nodes.items():
+        for v in self._node.nodes.values():
             if v.name not in noAdd and not v.hidden:
-                w = PyRogueLineEdit(parent=None, init_channel=self._path + '.{}/disp'.format(v.name))
-                w.showUnits             = False
-                w.precisionFromPV       = True
-                w.alarmSensitiveContent = False
-                w.alarmSensitiveBorder  = False
-
+                w = self._lineEdit(self._path + '.{}/disp'.format(v.name), True)
                 fl.addRow(v.name + ':',w)
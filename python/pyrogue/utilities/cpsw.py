@@ -13,7 +13,6 @@
 # contained in the LICENSE.txt file.
 #-----------------------------------------------------------------------------
 import pyrogue
-import math
 
 
 def exportRemoteVariable(variable,indent):
@@ -28,11 +27,12 @@ def exportRemoteVariable(variable,indent):
 
     for i in range(len(variable.bitOffset)):
 
-        offset    = variable.offset + int(variable.bitOffset[i] / 8)
-        bitOffset = int(variable.bitOffset[i] % 8)
+        offset    = variable.offset + (variable.bitOffset[i] >> 3)
+        bitOffset = variable.bitOffset[i] & 0x7
+        end       = offset + ((variable.bitSize[i] + 7) >> 3)
 
-        if (offset + math.ceil(variable.bitSize[i]/8)) > size:
-            size = offset + math.ceil(variable.bitSize[i]/8)
+        if end > size:
+            size = end
 
     if len(variable.bitOffset) > 1:
         name = f"{variable.name}[{i}]"
@@ -16,7 +16,9 @@
 import datetime
 import parse
 import pyrogue as pr
+import pyrogue.interfaces.simulation
 import rogue
+import rogue.interfaces.memory
 import rogue.hardware.axi
 import numpy as np
 
@@ -391,3 +393,123 @@ class AxiVersion(pr.Device):
 
     def countReset(self):
         print('AxiVersion count reset called')
+
+class CustBlockDev(pr.Device):
+
+    def __init__(self,**kwargs):
+
+        super().__init__(**kwargs)
+
+        # Reserve a 16-byte block at 0x10, variables start part way into it
+        self.addCustomBlock(rogue.interfaces.memory.Block(0x10,16))
+
+        self.add(pr.RemoteVariable(
+            name         = "CustVarA",
+            offset       =  0x18,
+            bitSize      =  32,
+            bitOffset    =  0x00,
+            base         = pr.UInt,
+            mode         = "RW",
+        ))
+
+        self.add(pr.RemoteVariable(
+            name         = "CustVarB",
+            offset       =  0x1C,
+            bitSize      =  16,
+            bitOffset    =  0x08,
+            base         = pr.UInt,
+            mode         = "RW",
+        ))
+
+class CustBlockOverDev(pr.Device):
+
+    def __init__(self,**kwargs):
+
+        super().__init__(**kwargs)
+
+        # Reserve an 8-byte block at 0x10, the second variable runs past its end
+        self.addCustomBlock(rogue.interfaces.memory.Block(0x10,8))
+
+        self.add(pr.RemoteVariable(
+            name         = "CustVarA",
+            offset       =  0x10,
+            bitSize      =  32,
+            bitOffset    =  0x00,
+            base         = pr.UInt,
+            mode         = "RW",
+        ))
+
+        self.add(pr.RemoteVariable(
+            name         = "CustVarB",
+            offset       =  0x14,
+            bitSize      =  64,
+            bitOffset    =  0x00,
+            base         = pr.UInt,
+            mode         = "RW",
+        ))
+
+class DummyTree(pr.Root):
+
+    def __init__(self, overflow=False):
+        pr.Root.__init__(self,
+                         name='dummyTree',
+                         description="Dummy tree for example",
+                         timeout=2.0,
+                         pollEn=False,
+                         serverPort=None)
+
+        # Use a memory space emulator
+        self._sim = pr.interfaces.simulation.MemEmulate()
+        self.addInterface(self._sim)
+
+        self.add(CustBlockDev(
+            name       = 'CustDev',
+            offset     = 0x0,
+            memBase    = self._sim,
+        ))
+
+        if overflow:
+            self.add(CustBlockOverDev(
+                name       = 'CustOverDev',
+                offset     = 0x1000,
+                memBase    = self._sim,
+            ))
+
+def test_custom_block():
+
+    with DummyTree() as root:
+
+        # Both variables must share the pre-made block
+        if root.CustDev.CustVarA._block is not root.CustDev.CustVarB._block:
+            raise AssertionError('CustVarA and CustVarB are not in the same pre-made block')
+
+        root.CustDev.CustVarA.set(0x12345678)
+        root.CustDev.CustVarB.set(0xABCD)
+
+        # Check the bytes landed at the variable offsets, not the block start
+        mem = [root._sim._data.get(0x10+i,0) for i in range(16)]
+        exp = [0]*8 + [0x78,0x56,0x34,0x12] + [0x00,0xCD,0xAB,0x00]
+
+        if mem != exp:
+            raise AssertionError(f'Memory mismatch: got {mem}, expected {exp}')
+
+        # Change memory behind the variables and read back
+        root._sim._data[0x18] = 0x11
+        root._sim._data[0x1E] = 0x22
+
+        retA = root.CustDev.CustVarA.get()
+        retB = root.CustDev.CustVarB.get()
+
+        if (retA != 0x12345611) or (retB != 0x22CD):
+            raise AssertionError(f'Verification Failure: retA={retA:#x}, retB={retB:#x}')
+
+    # A later variable running past the end of the pre-made block must be rejected
+    try:
+        with DummyTree(overflow=True):
+            pass
+        raise AssertionError('Variable past the end of a pre-made block did not raise an exception')
+    except pr.MemoryError:
+        pass
+
+if __name__ == "__main__":
+    test_custom_block()
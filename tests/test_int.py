@@ -123,6 +123,16 @@ def test_int():
         if (retAA != -1) or (retAB != 2) or (retBA != -2) or (retBB != -5) or (retBC != 7) or (retBD != -7):
             raise AssertionError(f'Verification Failure: retAA={retAA}, retAB={retAB}, retBA={retBA}, retBB={retBB}, retBC={retBC}, retBD={retBD}')
 
+def test_int_model():
+
+    for bitSize, value in [(8,-2), (16,-1), (7,-5), (5,7), (12,-2048), (32,-7)]:
+        for model in [pr.Int(bitSize), pr.IntBE(bitSize)]:
+            ret = model.fromBytes(model.toBytes(value))
+
+            if ret != value:
+                raise AssertionError(f'Verification Failure: model={model.name}, value={value}, ret={ret}')
+
 
 if __name__ == "__main__":
     test_int()
+    test_int_model()
@@ -288,6 +288,54 @@ def test_memory():
             if StringListBB[i] != StringListB[i]:
                 raise AssertionError(f'Verification Failure for StringListBB at position {i}')
 
+def test_yaml_keys():
+
+    with DummyTree() as root:
+
+        root.ListDevice.UInt32List.set([0] * 32)
+
+        def setKey(key, value):
+            root.setYaml(yml=f'dummyTree:\n  ListDevice:\n    UInt32List[{key}]: {value}\n',
+                         writeEach=False,
+                         modes=['RW','WO'],
+                         incGroups=None,
+                         excGroups=None)
+
+        exp = [0] * 32
+
+        # Single index
+        setKey('3', '103')
+        exp[3] = 103
+
+        # Negative index
+        setKey('-1', '131')
+        exp[-1] = 131
+
+        # Slice with start and stop
+        setKey('1:5', '201, 202, 203, 204')
+        exp[1:5] = [201, 202, 203, 204]
+
+        # Slice with step only
+        setKey('::2', ', '.join(str(300+i) for i in range(16)))
+        exp[::2] = [300+i for i in range(16)]
+
+        ret = root.ListDevice.UInt32List.get()
+
+        if ret != exp:
+            raise AssertionError(f'Verification Failure for yaml keys: got {ret}, expected {exp}')
+
+        # Malformed key must be rejected without touching the variable
+        try:
+            setKey('__import__("os")', '1')
+            raise AssertionError('Malformed yaml key did not raise an exception')
+        except ValueError:
+            pass
+
+        ret = root.ListDevice.UInt32List.get()
+
+        if ret != exp:
+            raise AssertionError(f'Malformed yaml key modified the variable: got {ret}, expected {exp}')
+
 def run_gui():
     import pyrogue.pydm
 
@@ -297,5 +345,6 @@ def run_gui():
 
 if __name__ == "__main__":
     test_memory()
+    test_yaml_keys()
     #run_gui()
 
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+#-----------------------------------------------------------------------------
+# This file is part of the rogue software platform. It is subject to
+# the license terms in the LICENSE.txt file found in the top-level directory
+# of this distribution and at:
+#    https://confluence.slac.stanford.edu/display/ppareg/LICENSE.html.
+# No part of the rogue software platform, including this file, may be
+# copied, modified, propagated, or distributed except according to the terms
+# contained in the LICENSE.txt file.
+#-----------------------------------------------------------------------------
+
+import pyrogue as pr
+import pyrogue.interfaces.simulation
+
+#rogue.Logging.setLevel(rogue.Logging.Debug)
+#import logging
+#logger = logging.getLogger('pyrogue')
+#logger.setLevel(logging.DEBUG)
+
+class DummyTree(pr.Root):
+
+    def __init__(self):
+        pr.Root.__init__(self,
+                         name='dummyTree',
+                         description="Dummy tree for example",
+                         timeout=2.0,
+                         pollEn=False,
+                         serverPort=None)
+
+        # Use a memory space emulator
+        self._sim = pr.interfaces.simulation.MemEmulate()
+        self.addInterface(self._sim)
+
+        self.add(pr.MemoryDevice(
+            name    = 'UIntMem',
+            offset  = 0x0000,
+            size    = 0x100,
+            base    = pr.UInt,
+            memBase = self._sim,
+        ))
+
+        self.add(pr.MemoryDevice(
+            name    = 'IntMem',
+            offset  = 0x1000,
+            size    = 0x100,
+            base    = pr.Int,
+            memBase = self._sim,
+        ))
+
+        self.add(pr.MemoryDevice(
+            name    = 'RevMem',
+            offset  = 0x2000,
+            size    = 0x100,
+            base    = pr.UIntReversed,
+            memBase = self._sim,
+        ))
+
+def test_memory_device_verify():
+
+    values = {
+        'UIntMem' : [0x12345678, 0x0, 0xFFFFFFFF, 0x1],
+        'IntMem'  : [-1, 0x7FFFFFFF, -0x80000000, 5],
+        'RevMem'  : [0x1, 0x80000000, 0x0000FFFF, 0xA5A5A5A5],
+    }
+
+    with DummyTree() as root:
+
+        for name, vals in values.items():
+            dev = root.nodes[name]
+
+            # Good write and verify
+            dev.set(0x10, vals, write=True)
+
+            ret = dev.get(0x10, len(vals))
+            if ret != vals:
+                raise AssertionError(f'{dev.path}: Verification Failure: got {ret}, expected {vals}')
+
+            # Write, then corrupt the backing memory before the verify read
+            dev.set(0x20, vals)
+            dev.writeBlocks()
+            dev._waitTransaction(0)
+
+            root._sim._data[dev.address + 0x24] ^= 0x01
+
+            dev.verifyBlocks()
+
+            try:
+                dev.checkBlocks()
+                raise AssertionError(f'{dev.path}: Corrupted memory did not raise a verify error')
+            except pr.MemoryError:
+                pass
+
+if __name__ == "__main__":
+    test_memory_device_verify()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+#-----------------------------------------------------------------------------
+# This file is part of the rogue software platform. It is subject to
+# the license terms in the LICENSE.txt file found in the top-level directory
+# of this distribution and at:
+#    https://confluence.slac.stanford.edu/display/ppareg/LICENSE.html.
+# No part of the rogue software platform, including this file, may be
+# copied, modified, propagated, or distributed except according to the terms
+# contained in the LICENSE.txt file.
+#-----------------------------------------------------------------------------
+
+import pyrogue as pr
+import pyrogue.protocols
+
+class FakeSerial(object):
+    """Serial port stand in, returns the queued response one byte at a time then times out"""
+
+    def __init__(self, response=b''):
+        self._rx = bytearray(response)
+        self.tx  = bytearray()
+
+    def read(self, size=1):
+        ret = bytes(self._rx[:size])
+        del self._rx[:size]
+        return ret
+
+    def write(self, data):
+        self.tx += data
+
+    def close(self):
+        pass
+
+class FakeTransaction(object):
+    """Memory transaction stand in which records the result"""
+
+    def __init__(self, address, data):
+        self._address = address
+        self._data    = bytearray(data)
+        self.errorMsg = None
+        self.isDone   = False
+
+    def address(self):
+        return self._address
+
+    def size(self):
+        return len(self._data)
+
+    def getData(self, ba, offset):
+        ba[:] = self._data[offset:offset+len(ba)]
+
+    def setData(self, ba, offset):
+        self._data[offset:offset+len(ba)] = ba
+
+    def error(self, msg):
+        self.errorMsg = msg
+
+    def done(self):
+        self.isDone = True
+
+def makeUart(response=b''):
+    # Skip the constructor, no serial device or worker thread is needed
+    uart = pyrogue.protocols.UartMemory.__new__(pyrogue.protocols.UartMemory)
+    uart._log = pr.logInit(cls=uart, name='test_uart')
+    uart.serialPort = FakeSerial(response)
+    return uart
+
+def test_uart_timeout():
+
+    # Read stops at the line ending
+    uart = makeUart(b'r 00000010 12345678 0\nr 00000014')
+    line = uart.readline()
+    if line != 'r 00000010 12345678 0\n':
+        raise AssertionError(f'readline returned {repr(line)}')
+
+    # Read returns the partial line on timeout
+    line = uart.readline()
+    if line != 'r 00000014':
+        raise AssertionError(f'readline returned {repr(line)} after timeout')
+
+    # Nothing received, the read transaction must error
+    uart = makeUart()
+    txn  = FakeTransaction(0x10, bytearray(4))
+    uart._doRead(txn)
+
+    if txn.isDone or txn.errorMsg is None or 'Empty transaction response' not in txn.errorMsg:
+        raise AssertionError(f'Read timeout did not error the transaction: done={txn.isDone}, error={txn.errorMsg}')
+
+    # Nothing received, the write transaction must error
+    uart = makeUart()
+    txn  = FakeTransaction(0x10, (0x12345678).to_bytes(4, 'little'))
+    uart._doWrite(txn)
+
+    if txn.isDone or txn.errorMsg is None or 'Empty transaction response' not in txn.errorMsg:
+        raise AssertionError(f'Write timeout did not error the transaction: done={txn.isDone}, error={txn.errorMsg}')
+
+    if bytes(uart.serialPort.tx) != b'w 00000010 12345678 \n':
+        raise AssertionError(f'Unexpected write command {bytes(uart.serialPort.tx)}')
+
+def test_uart_malformed():
+
+    # Good read response fills the data
+    uart = makeUart(b'r 00000010 12345678 0\n')
+    txn  = FakeTransaction(0x10, bytearray(4))
+    uart._doRead(txn)
+
+    if (not txn.isDone) or txn.errorMsg is not None or bytes(txn._data) != (0x12345678).to_bytes(4, 'little'):
+        raise AssertionError(f'Good read failed: done={txn.isDone}, error={txn.errorMsg}, data={bytes(txn._data)}')
+
+    # Response for the wrong address must error and stop before the next word
+    uart = makeUart(b'r 00000020 12345678 0\nr 00000014 9abcdef0 0\n')
+    txn  = FakeTransaction(0x10, bytearray(8))
+    uart._doRead(txn)
+
+    if txn.isDone or txn.errorMsg is None or 'Malformed response' not in txn.errorMsg:
+        raise AssertionError(f'Malformed read did not error the transaction: done={txn.isDone}, error={txn.errorMsg}')
+
+    if bytes(txn._data) != bytes(8):
+        raise AssertionError(f'Malformed read modified the transaction data: {bytes(txn._data)}')
+
+    if bytes(uart.serialPort.tx) != b'r 00000010 \n':
+        raise AssertionError(f'Read continued after a malformed response: {bytes(uart.serialPort.tx)}')
+
+    # Response with missing fields must error
+    uart = makeUart(b'r 00000010\n')
+    txn  = FakeTransaction(0x10, bytearray(4))
+    uart._doRead(txn)
+
+    if txn.isDone or txn.errorMsg is None or 'Malformed response' not in txn.errorMsg:
+        raise AssertionError(f'Short read response did not error the transaction: done={txn.isDone}, error={txn.errorMsg}')
+
+if __name__ == "__main__":
+    test_uart_timeout()
+    test_uart_malformed()